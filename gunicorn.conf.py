@@ -0,0 +1,13 @@
+# gunicorn -c gunicorn.conf.py app:app
+import gc
+
+bind = "127.0.0.1:5000"
+workers = 8
+# Import app.py (topic data, JSON payload, rendered and compressed page) once in the
+# master; forked workers then share those read-only pages copy-on-write.
+preload_app = True
+
+def when_ready(server):
+    # Keep the GC from touching the preloaded objects in each worker, which would
+    # write to their headers and un-share the pages
+    gc.freeze()
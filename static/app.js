@@ -0,0 +1,161 @@
+// JSON.parse is cheaper than evaluating the same data as an object literal
+const payload = JSON.parse(document.getElementById('topics-data').textContent);
+// Topics arrive grouped by category; gradients are computed once per category on the server
+const groups = payload.groups.map(([category, category_gradient, rows]) => ({
+  category,
+  category_gradient,
+  items: rows.map(([id, title, desc, link, _snippet, _search]) => ({
+    id, title, desc, _snippet, _search, category, category_gradient,
+    // absolute links are sent as-is, doc links relative to docs_base
+    tf_link: link.startsWith('https://') ? link : payload.docs_base + link,
+  })),
+}));
+const topics = groups.flatMap(g => g.items);
+const topicsById = new Map(topics.map(t => [t.id, t]));
+
+function copyToClipboard(text, btn) {
+  navigator.clipboard.writeText(text).then(() => {
+    const prev = btn.innerText;
+    btn.innerText = 'Copied';
+    setTimeout(()=> btn.innerText = prev, 1200);
+  }).catch(()=> {
+    btn.innerText = 'Copy failed';
+    setTimeout(()=> btn.innerText = 'Copy', 1200);
+  });
+}
+
+function buildHeader(g) {
+  const hdrCol = document.createElement('div');
+  hdrCol.className = 'col-12';
+  const headerDiv = document.createElement('div');
+  headerDiv.className = 'section-header';
+  const pill = document.createElement('span');
+  pill.className = 'category-pill';
+  pill.innerText = `# ${g.category}`;
+  // style pill with a generated gradient that's clearly visible
+  pill.style.background = g.category_gradient;
+  headerDiv.appendChild(pill);
+  // optional subtitle (keeps header readable)
+  const desc = document.createElement('div');
+  desc.className = 'section-desc';
+  desc.innerText = '';
+  headerDiv.appendChild(desc);
+  hdrCol.appendChild(headerDiv);
+  return hdrCol;
+}
+
+// Card markup is parsed once; each card is a clone with a few text slots filled in.
+// Clicks are handled by one delegated listener on #cards (see below).
+const CARD_TPL = document.createElement('template');
+// Layout lives in app.css classes rather than per-element inline styles.
+CARD_TPL.innerHTML = `<div class="col-12 col-md-6 col-xl-4"><div class="command-card p-3">
+  <h6 class="command-title"></h6><p class="command-desc"></p>
+  <div class="command-actions">
+    <a class="btn btn-sm btn-secondary command-docs" target="_blank">Official docs</a>
+    <button type="button" class="btn btn-sm btn-secondary command-toggle" data-action="toggle">Show example</button>
+  </div>
+  <div class="command-example"></div>
+</div></div>`;
+
+// The code block and Copy button are only built when a card's example is first shown
+const EXAMPLE_TPL = document.createElement('template');
+EXAMPLE_TPL.innerHTML = `<pre class="code-block"></pre>
+<div class="code-controls"><button class="btn btn-sm btn-light btn-copy" data-action="copy">Copy</button></div>`;
+
+function buildCard(t) {
+  const col = CARD_TPL.content.firstElementChild.cloneNode(true);
+  col.querySelector('.command-title').textContent = t.title;
+  col.querySelector('.command-desc').textContent = t.desc;
+  // match the "Show example" button color (bootstrap secondary)
+  col.querySelector('.command-docs').href = t.tf_link || '#';
+  // the example is looked up by id when first shown (see the click handler)
+  col.querySelector('.command-card').dataset.id = t.id;
+  return col;
+}
+
+// Cards are assembled offscreen, and the live DOM is touched once per refresh
+function buildCards(groups) {
+  const frag = document.createDocumentFragment();
+  groups.forEach(g => {
+    frag.appendChild(buildHeader(g));
+    g.items.forEach(t => frag.appendChild(buildCard(t)));
+  });
+  return frag;
+}
+
+// Group a filtered subset in one pass, keeping the order in which categories first appear
+function groupByCategory(items) {
+  const byCategory = new Map();
+  items.forEach(t => {
+    let g = byCategory.get(t.category);
+    if (!g) {
+      g = { category: t.category, category_gradient: t.category_gradient, items: [] };
+      byCategory.set(t.category, g);
+    }
+    g.items.push(t);
+  });
+  return [...byCategory.values()];
+}
+
+function render(ft) {
+  // no filter (the initial load): render the server-grouped data as is
+  if (!ft) return buildCards(groups);
+  // filter() keeps the server's order, so results need no re-sorting
+  const filtered = topics.filter(t => t._search.includes(ft));
+  return buildCards(groupByCategory(filtered));
+}
+
+// Recently rendered results by filter text (least recently used first), so
+// backspacing or retyping a query clones finished cards instead of rebuilding them.
+// Entries are kept pristine; only the inserted clone ever gets expanded examples.
+const renderCache = new Map();
+const RENDER_CACHE_MAX = 32;
+
+function refresh(filterText='') {
+  const ft = filterText.trim().toLowerCase();
+  let frag = renderCache.get(ft);
+  if (frag) {
+    renderCache.delete(ft);
+  } else {
+    frag = render(ft);
+    if (renderCache.size >= RENDER_CACHE_MAX) {
+      renderCache.delete(renderCache.keys().next().value);
+    }
+  }
+  renderCache.set(ft, frag);
+  document.getElementById('cards').replaceChildren(frag.cloneNode(true));
+}
+
+document.getElementById('cards').addEventListener('click', (e) => {
+  const btn = e.target.closest('[data-action]');
+  if (!btn) return;
+  const card = btn.closest('.command-card');
+  const exampleWrapper = card.querySelector('.command-example');
+  if (btn.dataset.action === 'toggle') {
+    const snippet = topicsById.get(card.dataset.id)._snippet;
+    if (exampleWrapper.childElementCount === 0 && snippet) {
+      const example = EXAMPLE_TPL.content.cloneNode(true);
+      example.querySelector('pre').textContent = snippet;
+      exampleWrapper.appendChild(example);
+    }
+    const open = exampleWrapper.classList.toggle('open');
+    btn.innerText = open ? 'Hide example' : 'Show example';
+  } else if (btn.dataset.action === 'copy') {
+    copyToClipboard(exampleWrapper.querySelector('pre').textContent, btn);
+  }
+});
+
+// Filter once typing pauses rather than on every intermediate keystroke
+let searchTimer;
+document.getElementById('search').addEventListener('input', (e)=> {
+  clearTimeout(searchTimer);
+  searchTimer = setTimeout(() => refresh(e.target.value), 80);
+});
+document.getElementById('reset').addEventListener('click', ()=> {
+  clearTimeout(searchTimer);
+  document.getElementById('search').value = '';
+  refresh('');
+});
+
+// initial render
+refresh('');